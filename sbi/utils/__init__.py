@@ -65,6 +65,7 @@ from sbi.utils.typechecks import (
 from sbi.utils.user_input_checks import (
     check_estimator_arg,
     check_prior,
+    mark_batched,
     process_prior,
     process_simulator,
     process_x,
@@ -77,6 +78,7 @@ from sbi.utils.user_input_checks_utils import MultipleIndependent
 __all__ = [
     "process_prior",
     "process_simulator",
+    "mark_batched",
     "BoxUniform",
     "MultipleIndependent",
     "RestrictedPrior",
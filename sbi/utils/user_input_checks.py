@@ -1,19 +1,47 @@
 # This file is part of sbi, a toolkit for simulation-based inference. sbi is licensed
 # under the Apache License Version 2.0, see <https://www.apache.org/licenses/>
 
+import contextlib
+import traceback
 import warnings
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union, cast
+from itertools import groupby
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary, WeakSet
 
+import numpy as np
 import torch
+from joblib import Parallel, delayed
 from numpy import ndarray
-from scipy.stats._distn_infrastructure import rv_frozen
-from scipy.stats._multivariate import multi_rv_frozen
 from torch import Tensor, float32, nn
-from torch.distributions import Distribution, Uniform
+from torch.distributions import (
+    Beta,
+    Distribution,
+    Exponential,
+    Gamma,
+    HalfNormal,
+    Independent,
+    Laplace,
+    LogNormal,
+    MultivariateNormal,
+    Normal,
+    Uniform,
+)
 
 from sbi.sbi_types import Array
-from sbi.utils.sbiutils import within_support
-from sbi.utils.torchutils import BoxUniform, atleast_2d
+from sbi.utils.sbiutils import Standardize, within_support
+from sbi.utils.torchutils import BoxUniform
 from sbi.utils.user_input_checks_utils import (
     CustomPriorWrapper,
     MultipleIndependent,
@@ -21,6 +49,54 @@ from sbi.utils.user_input_checks_utils import (
     PytorchReturnTypeWrapper,
 )
 
+if TYPE_CHECKING:
+    from scipy.stats._distn_infrastructure import rv_frozen
+    from scipy.stats._multivariate import multi_rv_frozen
+
+
+# Univariate distributions whose parameters can be stacked to vectorize independent
+# priors, see `merge_homogeneous_priors`.
+_MERGEABLE_PRIOR_TYPES = (
+    Beta,
+    Exponential,
+    Gamma,
+    HalfNormal,
+    Laplace,
+    LogNormal,
+    Normal,
+    Uniform,
+)
+
+# Sample shapes used to probe priors. `torch.Size` is immutable, so they are shared
+# instead of being created on every call.
+_SINGLE_SAMPLE_SHAPE = torch.Size((1,))
+_PRIOR_PROBE_SHAPE = torch.Size((10,))
+
+# Below this number of independent priors, processing them in parallel threads does
+# not pay off.
+_MIN_PRIORS_FOR_PARALLEL_PROCESSING = 8
+
+# Number of simulations used to probe a freshly built density estimator. Batch norm
+# layers in training mode, e.g., in embedding nets, fail on a single input.
+_NET_PROBE_BATCH_SIZE = 2
+
+# Distributions that can be re-instantiated from their parameters to change their
+# dtype, see `cast_prior_parameters`.
+_CASTABLE_PRIOR_TYPES = (*_MERGEABLE_PRIOR_TYPES, MultivariateNormal)
+
+# Processing functions per prior type, see `_process_prior`.
+_prior_processors: "WeakKeyDictionary[type, Callable]" = WeakKeyDictionary()
+
+# Priors per simulator which passed `check_sbi_inputs`, keyed on the user simulator
+# behind the wrappers of `process_simulator`. Weak references make sure that the
+# entries are removed once a simulator or prior is garbage collected.
+_validated_sbi_inputs: "WeakKeyDictionary[Callable, WeakSet]" = WeakKeyDictionary()
+
+# Structures of the embedding net together with the event shapes of theta and x which
+# passed `test_posterior_net_for_multi_d_x`, per type of density estimator. Embedding
+# net modules are stored by name, such that no types are kept alive.
+_validated_net_signatures: "WeakKeyDictionary[type, Set[Tuple]]" = WeakKeyDictionary()
+
 
 def check_prior(prior: Any) -> None:
     """Assert that prior is a PyTorch distribution (or pass if None)."""
@@ -36,8 +112,9 @@ def check_prior(prior: Any) -> None:
 
 
 def process_prior(
-    prior: Union[Sequence[Distribution], Distribution, rv_frozen, multi_rv_frozen],
+    prior: Union[Sequence[Distribution], Distribution, "rv_frozen", "multi_rv_frozen"],
     custom_prior_wrapper_kwargs: Optional[Dict] = None,
+    force: bool = False,
 ) -> Tuple[Distribution, int, bool]:
     """
     Return PyTorch distribution-like prior from user-provided prior.
@@ -63,6 +140,11 @@ def process_prior(
             Additional arguments passed to the wrapper class that processes the prior
             into a PyTorch Distribution, such as bounds (`lower_bound`, `upper_bound`)
             or argument constraints (`arg_constraints`).
+        force (bool):
+            The result of processing is stored on the prior object and reused when
+            the same prior is processed again (unless `custom_prior_wrapper_kwargs`
+            are passed). Set `force=True` to re-run all checks, e.g., after the
+            prior was modified in place.
 
     Raises:
         AttributeError: If prior objects lack `.sample()` or `.log_prob()`.
@@ -86,31 +168,199 @@ def process_prior(
         prior, theta_numel, prior_returns_numpy = process_prior(prior)
     """
 
+    # Kwargs can contain tensors which cannot be compared cheaply, so we only reuse
+    # results of calls without kwargs.
+    use_cache = not custom_prior_wrapper_kwargs
+    if use_cache and not force:
+        processed = getattr(prior, "_sbi_processed_prior", None)
+        if processed is not None:
+            return processed
+
+    processed = _process_prior(prior, custom_prior_wrapper_kwargs, force=force)
+
+    if use_cache:
+        # Stored on the prior itself such that it is freed together with it. This
+        # fails e.g. for lists or objects with `__slots__`.
+        with contextlib.suppress(AttributeError, TypeError):
+            prior._sbi_processed_prior = processed  # type: ignore
+
+    return processed
+
+
+def _process_prior(
+    prior: Union[Sequence[Distribution], Distribution, "rv_frozen", "multi_rv_frozen"],
+    custom_prior_wrapper_kwargs: Optional[Dict] = None,
+    force: bool = False,
+) -> Tuple[Distribution, int, bool]:
+    """Return PyTorch distribution-like prior, see :func:`process_prior`."""
+
+    # The matching processor only depends on the type of the prior, so the chain of
+    # `isinstance` checks is run once per type.
+    prior_type = type(prior)
+    processor = _prior_processors.get(prior_type)
+    if processor is None:
+        processor = _get_prior_processor(prior)
+        _prior_processors[prior_type] = processor
+
+    return processor(prior, custom_prior_wrapper_kwargs, force)
+
+
+def _get_prior_processor(prior: Any) -> Callable:
+    """Return the function that processes priors of the same type as `prior`."""
+
     # If prior is a sequence, assume independent components and check as PyTorch prior.
     if isinstance(prior, Sequence):
-        warnings.warn(
-            f"Prior was provided as a sequence of {len(prior)} priors. They will be "
-            "interpreted as independent of each other and matched in order to the "
-            "components of the parameter.",
-            stacklevel=2,
-        )
-        # process individual priors
-        prior = [process_prior(p, custom_prior_wrapper_kwargs)[0] for p in prior]
-        return process_pytorch_prior(MultipleIndependent(prior))
+        return _process_sequence_prior
 
     if isinstance(prior, Distribution):
-        return process_pytorch_prior(prior)
+        return _process_distribution_prior
 
-    # If prior is given as `scipy.stats` object, wrap as PyTorch.
-    elif isinstance(prior, (rv_frozen, multi_rv_frozen)):
-        raise NotImplementedError(
-            "Passing a prior as scipy.stats object is deprecated. "
-            "Please pass it as a PyTorch Distribution."
-        )
+    # If prior is given as `scipy.stats` object, wrap as PyTorch. Checking the module
+    # avoids importing `scipy.stats` for users who do not use it.
+    elif type(prior).__module__.startswith("scipy.stats"):
+        return _raise_scipy_prior_error
 
     # Otherwise it is a custom prior - check for `.sample()` and `.log_prob()`.
     else:
-        return process_custom_prior(prior, custom_prior_wrapper_kwargs)
+        return _process_custom_prior
+
+
+def _process_sequence_prior(
+    prior: Sequence,
+    custom_prior_wrapper_kwargs: Optional[Dict] = None,
+    force: bool = False,
+) -> Tuple[Distribution, int, bool]:
+    """Return independent priors combined as a single PyTorch prior.
+
+    With `force=True`, the components are processed again as well, even if they were
+    cached before.
+    """
+
+    warnings.warn(
+        f"Prior was provided as a sequence of {len(prior)} priors. They will be "
+        "interpreted as independent of each other and matched in order to the "
+        "components of the parameter.",
+        stacklevel=4,
+    )
+    # Merge runs of univariate priors of the same type such that they are
+    # evaluated with a single vectorized call.
+    merged_prior = merge_homogeneous_priors(prior)
+    if len(merged_prior) == 1 < len(prior):
+        return process_prior(merged_prior[0], custom_prior_wrapper_kwargs, force)
+    # Process individual priors, in parallel threads if there are many of them.
+    if len(merged_prior) < _MIN_PRIORS_FOR_PARALLEL_PROCESSING:
+        results = [
+            process_prior(p, custom_prior_wrapper_kwargs, force) for p in merged_prior
+        ]
+    else:
+        results = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(process_prior)(p, custom_prior_wrapper_kwargs, force)
+            for p in merged_prior
+        )
+    processed_prior = [result[0] for result in results]
+    return process_pytorch_prior(MultipleIndependent(processed_prior))
+
+
+def _process_distribution_prior(
+    prior: Distribution,
+    custom_prior_wrapper_kwargs: Optional[Dict] = None,
+    force: bool = False,
+) -> Tuple[Distribution, int, bool]:
+    """Return PyTorch prior, `custom_prior_wrapper_kwargs` and `force` are ignored."""
+    return process_pytorch_prior(prior)
+
+
+def _process_custom_prior(
+    prior: Any,
+    custom_prior_wrapper_kwargs: Optional[Dict] = None,
+    force: bool = False,
+) -> Tuple[Distribution, int, bool]:
+    """Return wrapped custom prior, `force` is ignored."""
+    return process_custom_prior(prior, custom_prior_wrapper_kwargs)
+
+
+def _raise_scipy_prior_error(
+    prior: Any,
+    custom_prior_wrapper_kwargs: Optional[Dict] = None,
+    force: bool = False,
+) -> Tuple[Distribution, int, bool]:
+    """Raise for `scipy.stats` priors, which are no longer supported."""
+    raise NotImplementedError(
+        "Passing a prior as scipy.stats object is deprecated. "
+        "Please pass it as a PyTorch Distribution."
+    )
+
+
+def merge_homogeneous_priors(priors: Sequence) -> List:
+    """Return priors where consecutive univariate priors of the same type are merged.
+
+    Consecutive PyTorch distributions of the same type (e.g., `Normal`) with
+    `batch_shape=torch.Size([1])` and parameters of matching dtype and device are
+    stacked into a single distribution with `event_shape=torch.Size([n])`. The order
+    of the parameter dimensions is preserved, all other priors are returned as is.
+
+    Args:
+        priors: Sequence of independent priors as passed by the user.
+
+    Returns:
+        List of priors, each element covering one or more parameter dimensions.
+    """
+
+    def group_key(p) -> Optional[Tuple]:
+        if type(p) not in _MERGEABLE_PRIOR_TYPES or p.batch_shape != torch.Size([1]):
+            return None
+        params = [getattr(p, name) for name in p.arg_constraints]
+        return type(p), tuple((v.dtype, v.device) for v in params)
+
+    merged = []
+    for key, group in groupby(priors, key=group_key):
+        group = list(group)
+        if key is None or len(group) == 1:
+            merged.extend(group)
+        else:
+            params = {
+                name: torch.cat([getattr(p, name) for p in group])
+                for name in group[0].arg_constraints
+            }
+            merged.append(Independent(type(group[0])(**params), 1))
+    return merged
+
+
+def cast_prior_parameters(
+    prior: Distribution, dtype: torch.dtype
+) -> Optional[Distribution]:
+    """Return the prior re-instantiated with parameters of the given `dtype`.
+
+    This is only possible for distributions whose parameters are fully described by
+    their `arg_constraints` (and `Independent` wrappers around those), for all others
+    `None` is returned.
+
+    Args:
+        prior: PyTorch distribution.
+        dtype: Target dtype of the parameters.
+
+    Returns:
+        The re-instantiated prior or `None` if it cannot be re-instantiated.
+    """
+
+    if type(prior) is Independent:
+        base_dist = cast_prior_parameters(prior.base_dist, dtype)
+        if base_dist is None:
+            return None
+        return Independent(
+            base_dist, prior.reinterpreted_batch_ndims, validate_args=False
+        )
+
+    if type(prior) not in _CASTABLE_PRIOR_TYPES:
+        return None
+
+    if isinstance(prior, MultivariateNormal):
+        # Only one of the equivalent parametrizations can be passed.
+        params = dict(loc=prior.loc, scale_tril=prior.scale_tril)
+    else:
+        params = {name: getattr(prior, name) for name in prior.arg_constraints}
+    params = {name: value.to(dtype) for name, value in params.items()}
+    return type(prior)(**params, validate_args=False)
 
 
 def process_custom_prior(
@@ -132,19 +382,25 @@ def process_custom_prior(
         is_prior_numpy: Whether the prior returned Numpy arrays before wrapping.
     """
 
-    check_prior_attributes(prior)
-    check_prior_batch_behavior(prior)
+    # Sample a batch of parameters once and reuse it for all checks below.
+    num_samples = 2
+    theta, log_probs = check_prior_attributes(prior, num_samples=num_samples)
+    check_prior_batch_behavior(
+        prior, num_samples=num_samples, theta=theta, log_probs=log_probs
+    )
     prior, is_prior_numpy = maybe_wrap_prior_as_pytorch(
-        prior, custom_prior_wrapper_kwargs
+        prior, custom_prior_wrapper_kwargs, probe=(theta, log_probs)
     )
     check_prior_return_type(prior)
-    theta_numel = prior.sample().numel()
+    theta_numel = prior.event_shape.numel()
 
     return prior, theta_numel, is_prior_numpy
 
 
 def maybe_wrap_prior_as_pytorch(
-    prior, custom_prior_wrapper_kwargs: Optional[Dict[str, Any]] = None
+    prior,
+    custom_prior_wrapper_kwargs: Optional[Dict[str, Any]] = None,
+    probe: Optional[Tuple[Any, Any]] = None,
 ) -> Tuple[Distribution, bool]:
     """Check prior return type and maybe wrap as PyTorch.
 
@@ -155,6 +411,8 @@ def maybe_wrap_prior_as_pytorch(
             prior with bounded support (lower_bound, upper_bound), or argument
             constraints.
             (arg_constraints), see pytorch.distributions.Distribution for more info.
+        probe: Batch of parameters sampled from the prior and their log probs, e.g.,
+            as returned by `check_prior_attributes`. If `None`, they are sampled.
 
     Raises:
         TypeError: If prior return type is PyTorch or Numpy.
@@ -164,8 +422,11 @@ def maybe_wrap_prior_as_pytorch(
         is_prior_numpy: Whether the prior returned Numpy arrays before wrapping.
     """
 
-    theta = prior.sample((1,))
-    log_probs = prior.log_prob(theta)
+    if probe is None:
+        theta = prior.sample(_SINGLE_SAMPLE_SHAPE)
+        log_probs = prior.log_prob(theta)
+    else:
+        theta, log_probs = probe
 
     # Check return types
     if isinstance(theta, Tensor) and isinstance(log_probs, Tensor):
@@ -173,13 +434,13 @@ def maybe_wrap_prior_as_pytorch(
         # that the custom prior can be a probabilistic program.
         prior = CustomPriorWrapper(
             custom_prior=prior,
-            event_shape=torch.Size([theta.numel()]),
+            event_shape=torch.Size([theta[0].numel()]),
             **custom_prior_wrapper_kwargs or {},
         )
         is_prior_numpy = False
     elif isinstance(theta, ndarray) and isinstance(log_probs, ndarray):
         # infer event shape from single numpy sample.
-        event_shape = torch.Size([theta.size])
+        event_shape = torch.Size([theta[0].size])
         prior = CustomPriorWrapper(
             custom_prior=prior,
             event_shape=event_shape,
@@ -212,9 +473,22 @@ def process_pytorch_prior(prior: Distribution) -> Tuple[Distribution, int, bool]
     # of the support.
     prior.set_default_validate_args(False)
 
-    # Reject unwrapped scalar priors.
+    num_samples = _PRIOR_PROBE_SHAPE[0]
+    if has_reliable_shapes(prior):
+        # Shapes and dtype of these distributions are fully determined by their
+        # parameters, so no samples are needed for the checks below.
+        theta = None
+        theta_shape = prior.batch_shape + prior.event_shape
+        dtype = prior.mean.dtype
+    else:
+        # Sample a single batch of parameters which is reused by all checks below.
+        theta = prior.sample(_PRIOR_PROBE_SHAPE)
+        theta_shape = theta.shape[1:]
+        dtype = theta.dtype
+
+    # Reject unwrapped scalar priors, i.e., priors whose single samples are 0D.
     # This will reject Uniform priors with dimension larger than 1.
-    if prior.sample().ndim == 0:
+    if len(theta_shape) == 0:
         raise ValueError(
             "Detected scalar prior. Please make sure to pass a PyTorch prior with "
             "`batch_shape=torch.Size([1])` or `event_shape=torch.Size([1])`."
@@ -222,32 +496,62 @@ def process_pytorch_prior(prior: Distribution) -> Tuple[Distribution, int, bool]
     # Cast 1D Uniform to BoxUniform to avoid shape error in mdn log prob.
     elif isinstance(prior, Uniform) and prior.batch_shape.numel() == 1:
         prior = BoxUniform(low=prior.low, high=prior.high)
+        # `BoxUniform` casts its bounds to float32.
+        dtype = float32
         warnings.warn(
             "Casting 1D Uniform prior to BoxUniform to match sbi batch requirements.",
             stacklevel=2,
         )
 
-    check_prior_batch_behavior(prior)
-    check_prior_batch_dims(prior)
-
-    if prior.sample().dtype != float32:
-        prior = PytorchReturnTypeWrapper(
-            prior, return_type=float32, validate_args=False
+    if theta is None:
+        # `log_prob()` of PyTorch distributions returns `sample_shape + batch_shape`.
+        log_prob_shape = _PRIOR_PROBE_SHAPE + prior.batch_shape
+    else:
+        theta, log_probs = check_prior_batch_behavior(
+            prior, num_samples=num_samples, theta=theta
         )
+        log_prob_shape = log_probs.shape
+    check_prior_batch_dims(prior)
 
-    # This will fail for float64 priors.
-    check_prior_return_type(prior)
+    if dtype is not float32:
+        # Casting the parameters once avoids casting every sample and log prob.
+        float32_prior = cast_prior_parameters(prior, float32)
+        if float32_prior is None:
+            prior = PytorchReturnTypeWrapper(
+                prior, return_type=float32, validate_args=False
+            )
+        else:
+            prior = float32_prior
+        # This will fail for float64 priors, so we have to sample the new prior.
+        check_prior_return_type(prior)
+    elif theta is not None:
+        check_prior_return_type(prior, theta=theta)
 
     # Potentially required wrapper if the prior returns an additional sample dimension
     # for `.log_prob()`.
-    if prior.log_prob(prior.sample(torch.Size((10,)))).shape == torch.Size([10, 1]):
+    if log_prob_shape == torch.Size([num_samples, 1]):
         prior = OneDimPriorWrapper(prior, validate_args=False)
 
-    theta_numel = prior.sample().numel()
+    theta_numel = theta_shape.numel()
 
     return prior, theta_numel, False
 
 
+def has_reliable_shapes(prior: Distribution) -> bool:
+    """Return whether sample shapes and dtype of the prior follow from its parameters.
+
+    This holds for a set of continuous PyTorch distributions (and `Independent`
+    wrappers around them), for which samples have shape `batch_shape + event_shape`
+    and the dtype of the distribution's `mean`.
+    """
+
+    if isinstance(prior, BoxUniform):
+        return True
+    if type(prior) is Independent:
+        return has_reliable_shapes(prior.base_dist)
+    return type(prior) in _CASTABLE_PRIOR_TYPES
+
+
 def check_prior_batch_dims(prior) -> None:
     """Check if batch shape of the prior is smaller or equal to 1.
 
@@ -356,16 +660,19 @@ def check_for_possibly_batched_x_shape(x_shape):
         pass
 
 
-def check_prior_attributes(prior) -> None:
+def check_prior_attributes(prior, num_samples: int = 2) -> Tuple[Any, Any]:
     """Check for prior methods sample(sample_shape) .log_prob(value) methods.
 
     Raises:
         AttributeError: if either of the two methods doesn't exist.
+
+    Returns:
+        The sampled parameters and their log probs, such that callers can reuse
+        them instead of sampling again.
     """
 
-    # Sample a batch of two parameters to check batch behaviour > 1 and that
-    # `.sample()` can handle a tuple argument.
-    num_samples = 2
+    # Sample a batch of (by default) two parameters to check batch behaviour > 1 and
+    # that `.sample()` can handle a tuple argument.
     try:
         theta = prior.sample((num_samples,))
     except AttributeError as err:
@@ -375,8 +682,8 @@ def check_prior_attributes(prior) -> None:
     except TypeError as err:
         raise TypeError(
             f"""The `prior.sample()` method must accept Tuple arguments, e.g.,
-            prior.sample(({num_samples}, )) to sample a batch of 2 parameters. Consider
-            using a PyTorch distribution."""
+            prior.sample(({num_samples}, )) to sample a batch of {num_samples}
+            parameters. Consider using a PyTorch distribution."""
         ) from err
     except Exception as err:  # Catch any other error.
         raise ValueError(
@@ -385,7 +692,7 @@ def check_prior_attributes(prior) -> None:
             PyTorch distribution."""
         ) from err
     try:
-        prior.log_prob(theta)
+        log_probs = prior.log_prob(theta)
     except AttributeError as err:
         raise AttributeError(
             "Prior needs method `.log_prob()`. Consider using a PyTorch distribution."
@@ -396,25 +703,45 @@ def check_prior_attributes(prior) -> None:
             with `prior.log_prob(theta)`. Consider using a PyTorch distribution."""
         ) from err
 
+    return theta, log_probs
+
 
 def check_prior_return_type(
-    prior, return_type: Optional[torch.dtype] = float32
+    prior, return_type: Optional[torch.dtype] = float32, theta: Optional[Any] = None
 ) -> None:
-    """Check whether prior.sample() returns float32 Tensor."""
+    """Check whether prior.sample() returns float32 Tensor.
+
+    If `theta` is passed, it is used instead of a new sample from the prior.
+    """
 
-    prior_dtype = prior.sample().dtype
+    prior_dtype = (prior.sample() if theta is None else theta).dtype
     assert prior_dtype == return_type, (
         f"Prior return type must be {return_type}, but is {prior_dtype}."
     )
 
 
-def check_prior_batch_behavior(prior) -> None:
-    """Assert that it is possible to sample and evaluate batches of parameters."""
+def check_prior_batch_behavior(
+    prior,
+    num_samples: int = 4,
+    theta: Optional[Any] = None,
+    log_probs: Optional[Any] = None,
+) -> Tuple[Any, Any]:
+    """Assert that it is possible to sample and evaluate batches of parameters.
+
+    If a batch of parameters `theta` obtained with `prior.sample((num_samples,))`
+    (and optionally their `log_probs`) is passed, it is checked instead of sampling a
+    new batch.
+
+    Returns:
+        The checked parameters and their log probs, such that callers can reuse them
+        instead of sampling again.
+    """
 
     # Check for correct batch size in .sample and .log_prob
-    num_samples = 1
-    theta = prior.sample((num_samples,))
-    log_probs = prior.log_prob(theta)
+    if theta is None:
+        theta = prior.sample((num_samples,))
+    if log_probs is None:
+        log_probs = prior.log_prob(theta)
 
     assert (
         len(theta.shape) >= 2
@@ -433,21 +760,32 @@ def check_prior_batch_behavior(prior) -> None:
         "prior.log_prob must return as many log probs as samples."
     )
 
+    return theta, log_probs
+
 
 def check_prior_support(prior):
     """Check whether prior allows to check for support.
 
-    This either uses the PyTorch support property, or the custom prior .logprob method
+    This either uses the PyTorch support property, or the custom prior .logprob method.
+    A successful check is remembered on the prior, such that priors reused across
+    rounds are not sampled again.
     """
 
+    if getattr(prior, "_sbi_support_checked", False):
+        return
+
     try:
-        within_support(prior, prior.sample((1,)))
+        within_support(prior, prior.sample(_SINGLE_SAMPLE_SHAPE))
     except NotImplementedError as err:
         raise NotImplementedError(
             """The prior must implement the support property or allow to call
             .log_prob() outside of support."""
         ) from err
 
+    # Priors that do not allow setting attributes are simply checked every time.
+    with contextlib.suppress(AttributeError, TypeError):
+        prior._sbi_support_checked = True
+
 
 def check_data_device(datum_1: torch.Tensor, datum_2: torch.Tensor) -> None:
     """Checks if two tensors have the seme device. Fails if there is a device
@@ -465,10 +803,54 @@ def check_data_device(datum_1: torch.Tensor, datum_2: torch.Tensor) -> None:
     )
 
 
+def mark_batched(simulator: Callable) -> Callable:
+    """Mark a simulator as able to simulate a batch of parameters per call.
+
+    Simulators marked this way are used as is by :func:`process_simulator`, i.e.,
+    without running a probe simulation to check their output shape. Can be used as
+    a decorator.
+
+    Args:
+        simulator: simulator that maps parameters of shape `(batch_size, *theta_shape)`
+            to simulations of shape `(batch_size, *x_shape)`.
+
+    Returns:
+        The same simulator, flagged as batched. For bound methods, the flag is set on
+        the underlying function, i.e., for all instances of the class.
+
+    Raises:
+        TypeError: If the simulator does not allow setting attributes, e.g., for
+            builtins. Wrap it in a Python function and mark that instead.
+
+    Example:
+    --------
+
+    ::
+
+        from sbi.utils import mark_batched
+
+        @mark_batched
+        def simulator(theta):
+            return theta + torch.randn_like(theta)
+    """
+    # Attributes of bound methods are read from, but cannot be set on the method.
+    target = getattr(simulator, "__func__", simulator)
+    try:
+        target._sbi_batched = True
+    except (AttributeError, TypeError) as err:
+        raise TypeError(
+            f"Cannot mark simulator of type {type(simulator).__name__} as batched. "
+            "Please wrap it in a Python function and mark that function instead."
+        ) from err
+    return simulator
+
+
 def process_simulator(
     user_simulator: Callable,
     prior: Distribution,
     is_numpy_simulator: bool,
+    num_workers: int = 1,
+    x_event_shape: Optional[torch.Size] = None,
 ) -> Callable:
     """Returns a simulator that meets the requirements for usage in sbi.
 
@@ -480,6 +862,14 @@ def process_simulator(
         is_numpy_simulator (bool):
             whether the simulator needs theta in numpy types, returned
             from `process_prior`.
+        num_workers (int):
+            number of threads used to loop over a batch of parameters if the
+            simulator cannot handle batches itself. `-1` uses all available cores.
+            Only pays off if the simulator releases the GIL, e.g., when it is
+            dominated by PyTorch or NumPy operations.
+        x_event_shape (torch.Size, optional):
+            shape of a single simulation output, if known. Used to check the
+            simulations if the simulator cannot handle batches itself.
 
     Returns:
         Callable:
@@ -508,61 +898,82 @@ def process_simulator(
         user_simulator, prior, is_numpy_simulator
     )
 
-    batch_simulator = ensure_batched_simulator(joblib_simulator, prior)
+    batch_simulator = ensure_batched_simulator(
+        joblib_simulator, prior, num_workers=num_workers, x_event_shape=x_event_shape
+    )
 
     return batch_simulator
 
 
 # New simulator wrapper, deriving from #1175 refactoring of simulate_for_sbi.
-# For now it just blindly applies a cast to tensor to the input and the output
-# of the simulator. This is not efficient (~3 times slowdown), but is compatible
-# with the new joblib and, importantly, does not break previous code. It should
-# be removed with a future restructuring of the simulation pipeline.
+# Parameters may arrive as `ndarray` (joblib workers) or `Tensor` (sequential
+# simulation), so the wrapper casts them to the type the simulator expects. The
+# wrapper is specialized at creation time on `is_numpy_simulator` and only casts
+# where the types actually differ, such that torch-native simulators returning
+# float32 tensors are called without any conversion. Note that the wrapper cannot be
+# compiled with TorchScript or `torch.compile` because it calls arbitrary Python code.
 def wrap_as_joblib_efficient_simulator(
     simulator: Callable, prior, is_numpy_simulator
 ) -> Callable:
-    """Return a simulator that accepts `ndarray` and returns `Tensor` arguments."""
+    """Return a simulator that accepts `ndarray` or `Tensor` and returns `Tensor`."""
 
-    def joblib_simulator(theta: ndarray) -> Tensor:
-        return torch.as_tensor(simulator(torch.as_tensor(theta)), dtype=float32)
+    if is_numpy_simulator:
 
+        def joblib_simulator(theta: Union[ndarray, Tensor]) -> Tensor:
+            if isinstance(theta, Tensor):
+                theta = theta.cpu().numpy()
+            return torch.as_tensor(simulator(theta), dtype=float32)
+
+    else:
+
+        def joblib_simulator(theta: Union[ndarray, Tensor]) -> Tensor:
+            x = simulator(torch.as_tensor(theta))
+            if isinstance(x, Tensor) and x.dtype == float32:
+                return x
+            return torch.as_tensor(x, dtype=float32)
+
+    # Link the user simulator such that e.g. `check_sbi_inputs` recognizes it.
+    joblib_simulator.__wrapped__ = simulator
+    if getattr(simulator, "_sbi_batched", False):
+        joblib_simulator._sbi_batched = True
     return joblib_simulator
 
 
-# Probably not used anymore
 def wrap_as_pytorch_simulator(
     simulator: Callable, prior, is_numpy_simulator
 ) -> Callable:
-    """Return a simulator that accepts and returns `Tensor` arguments."""
+    """Return a simulator that accepts and returns `Tensor` arguments.
 
-    if is_numpy_simulator:
-        # Get data to check input type is consistent with data.
-        theta = prior.sample().numpy()  # Cast to numpy because is in PyTorch already.
-        x = simulator(theta)
-        assert isinstance(x, ndarray), (
-            f"Simulator output type {type(x)} must match its input type {type(theta)}"
-        )
-
-        # Define a wrapper function to PyTorch
-        def pytorch_simulator(theta: Tensor) -> Tensor:
-            return torch.as_tensor(simulator(theta.numpy()), dtype=float32)
-
-    else:
-        # Define a wrapper to make sure that the output of the simulator is `float32`.
-        def pytorch_simulator(theta: Tensor) -> Tensor:
-            return torch.as_tensor(simulator(theta), dtype=float32)
+    NOTE: This function is deprecated, use `wrap_as_joblib_efficient_simulator`.
+    """
 
-    return pytorch_simulator
+    warnings.warn(
+        "`wrap_as_pytorch_simulator` is deprecated and will be removed in a future "
+        "release. Please use `wrap_as_joblib_efficient_simulator` instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return wrap_as_joblib_efficient_simulator(simulator, prior, is_numpy_simulator)
 
 
-def ensure_batched_simulator(simulator: Callable, prior) -> Callable:
+def ensure_batched_simulator(
+    simulator: Callable,
+    prior,
+    num_workers: int = 1,
+    x_event_shape: Optional[torch.Size] = None,
+) -> Callable:
     """Return a simulator with batched output.
 
     Return the unchanged simulator if it can already simulate multiple parameter
     vectors per call. Otherwise, wrap as simulator with batched output (leading batch
-    dimension of shape [1]).
+    dimension of shape [1]), looping over the batch with `num_workers` threads.
+    Simulators flagged with :func:`mark_batched` are returned without running a
+    probe simulation.
     """
 
+    if getattr(simulator, "_sbi_batched", False):
+        return simulator
+
     is_batched_simulator = True
     try:
         batch_size = 2
@@ -573,23 +984,58 @@ def ensure_batched_simulator(simulator: Callable, prior) -> Callable:
     except Exception:
         is_batched_simulator = False
 
-    return simulator if is_batched_simulator else get_batch_loop_simulator(simulator)
+    if is_batched_simulator:
+        return simulator
+    return get_batch_loop_simulator(
+        simulator, num_workers=num_workers, x_event_shape=x_event_shape
+    )
 
 
-def get_batch_loop_simulator(simulator: Callable) -> Callable:
-    """Return simulator wrapped with `map` to handle batches of parameters.
+def get_batch_loop_simulator(
+    simulator: Callable,
+    num_workers: int = 1,
+    x_event_shape: Optional[torch.Size] = None,
+) -> Callable:
+    """Return simulator wrapped with a loop to handle batches of parameters.
 
     Note: this batches the simulator only syntactically, there are no performance
-    benefits as with true vectorization."""
+    benefits as with true vectorization. With `num_workers != 1`, the parameters are
+    distributed over a pool of threads, which speeds up simulators that release the
+    GIL. Otherwise, the simulations are written into a batch which is allocated with
+    the dtype and device of the first simulation. If `x_event_shape` is given, all
+    simulations are checked to have this shape."""
 
     def batch_loop_simulator(theta: Tensor) -> Tensor:
         """Return a batch of simulations by looping over a batch of parameters."""
         assert theta.ndim > 1, "Theta must have a batch dimension."
-        # Simulate in loop
-        xs = list(map(simulator, theta))
-        # Stack over batch to keep x_shape
-        return torch.stack(xs)
-
+        if num_workers != 1:
+            xs = Parallel(n_jobs=num_workers, prefer="threads")(
+                delayed(simulator)(t) for t in theta
+            )
+            # Stack over batch to keep x_shape
+            return torch.stack(xs)
+
+        # Simulate in loop and write into a batch allocated like the first simulation,
+        # such that simulations stay on the device the simulator puts them.
+        x = simulator(theta[0])
+        if x_event_shape is not None:
+            assert x.shape == x_event_shape, (
+                f"Simulation output shape {x.shape} does not match the given "
+                f"`x_event_shape` {x_event_shape}."
+            )
+        xs = torch.empty((len(theta), *x.shape), dtype=x.dtype, device=x.device)
+        xs[0] = x
+        for i in range(1, len(theta)):
+            x = simulator(theta[i])
+            # Avoid silent broadcasting into the preallocated batch.
+            assert x.shape == xs.shape[1:], (
+                f"Simulation output shape {x.shape} does not match the shape of "
+                f"previous simulations {xs.shape[1:]}."
+            )
+            xs[i] = x
+        return xs
+
+    batch_loop_simulator.__wrapped__ = getattr(simulator, "__wrapped__", simulator)
     return batch_loop_simulator
 
 
@@ -610,18 +1056,30 @@ def process_x(x: Array, x_event_shape: Optional[torch.Size] = None) -> Tensor:
         x: Observed data with shape ready for usage in sbi.
     """
 
-    x = atleast_2d(torch.as_tensor(x, dtype=float32))
+    if isinstance(x, ndarray):
+        # Let numpy cast (a no-op for contiguous float32 arrays) and share its memory.
+        # This also handles arrays with negative strides, e.g., after `x[::-1]`.
+        x = torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32))
+    else:
+        x = torch.as_tensor(x, dtype=float32)
 
-    if x_event_shape is not None and len(x_event_shape) > len(x.shape):
-        raise ValueError(
-            f"You passed an `x` of shape {x.shape} but the `x_event_shape` (inferred "
-            f"from simulations) is {x_event_shape}. We are raising this error because "
-            f"len(x_event_shape) > len(x.shape)"
-        )
+    # Resolve the final shape first such that `x` is reshaped at most once.
+    x_shape = x.shape if x.ndim >= 2 else torch.Size((1, x.numel()))
 
-    # If x_shape is provided, we can fix a missing batch dim for >1D data.
-    if x_event_shape is not None and len(x_event_shape) == len(x.shape):
-        x = x.unsqueeze(0)
+    if x_event_shape is not None:
+        x_event_ndim = len(x_event_shape)
+        if x_event_ndim > len(x_shape):
+            raise ValueError(
+                f"You passed an `x` of shape {x_shape} but the `x_event_shape` "
+                f"(inferred from simulations) is {x_event_shape}. We are raising this "
+                f"error because len(x_event_shape) > len(x.shape)"
+            )
+        # If x_shape is provided, we can fix a missing batch dim for >1D data.
+        if x_event_ndim == len(x_shape):
+            x_shape = torch.Size((1, *x_shape))
+
+    if x_shape != x.shape:
+        x = x.reshape(x_shape)
 
     input_x_shape = x.shape
 
@@ -688,9 +1146,20 @@ def check_sbi_inputs(simulator: Callable, prior: Distribution) -> None:
         prior: prior (Distribution like)
         x_shape: Shape of single simulation output $x$.
     """
+    # Pairs that passed the checks before are not simulated again. Simulators from
+    # `process_simulator` are new wrappers on every call, so they are identified by
+    # the user simulator they wrap.
+    user_simulator = getattr(simulator, "__wrapped__", simulator)
+    try:
+        if prior in _validated_sbi_inputs.get(user_simulator, ()):
+            return
+    except TypeError:
+        # Simulator or prior cannot be weakly referenced or hashed.
+        pass
+
     check_prior_support(prior)
-    num_prior_samples = 1
-    theta = prior.sample(torch.Size((num_prior_samples,)))
+    num_prior_samples = _SINGLE_SAMPLE_SHAPE[0]
+    theta = prior.sample(_SINGLE_SAMPLE_SHAPE)
     theta_batch_shape, *_ = theta.shape
     simulation = simulator(theta)
     sim_batch_shape, *sim_event_shape = simulation.shape
@@ -707,6 +1176,9 @@ def check_sbi_inputs(simulator: Callable, prior: Distribution) -> None:
     ), f"""Simulation batch shape {sim_batch_shape} must match
         num_samples={num_prior_samples}."""
 
+    with contextlib.suppress(TypeError):
+        _validated_sbi_inputs.setdefault(user_simulator, WeakSet()).add(prior)
+
 
 def check_estimator_arg(estimator: Union[str, Callable]) -> None:
     """Check (density or ratio) estimator argument passed by the user."""
@@ -756,23 +1228,29 @@ def validate_theta_and_x(
     assert theta.dtype == float32, "Type of parameters must be float32."
     assert x.dtype == float32, "Type of simulator outputs must be float32."
 
-    if str(x.device) != str(data_device):
+    # Compare `torch.device`s instead of their string representations.
+    data_device_ = torch.device(data_device)
+    # Copies to a CUDA device are ordered with later kernels on the same stream, so
+    # they need not block the host. Copies to the host must block to be safe to read.
+    non_blocking = data_device_.type == "cuda"
+
+    if x.device != data_device_:
         warnings.warn(
             f"Data x has device '{x.device}'. "
             f"Moving x to the data_device '{data_device}'. "
             f"Training will proceed on device '{training_device}'.",
             stacklevel=2,
         )
-        x = x.to(data_device)
+        x = x.to(data_device_, non_blocking=non_blocking)
 
-    if str(theta.device) != str(data_device):
+    if theta.device != data_device_:
         warnings.warn(
             f"Parameters theta has device '{theta.device}'. "
             f"Moving theta to the data_device '{data_device}'. "
             f"Training will proceed on device '{training_device}'.",
             stacklevel=2,
         )
-        theta = theta.to(data_device)
+        theta = theta.to(data_device_, non_blocking=non_blocking)
 
     return theta, x
 
@@ -782,27 +1260,92 @@ def test_posterior_net_for_multi_d_x(net, theta: Tensor, x: Tensor) -> None:
 
     This is done to make sure the net can handle multidimensional inputs via an
     embedding net. If not, it usually fails with a RuntimeError. Here we catch the
-    error, append a debug hint and raise it again.
+    error, append a debug hint and raise it again. Errors for one-dimensional x are
+    raised unchanged. The check is run only once per combination of net type,
+    embedding net structure and event shapes of theta and x, e.g., for the members of
+    an ensemble.
 
     Args:
         net: A `DensityEstimator`.
+        theta: Parameters of shape `(sample_dim, batch_dim, *event_shape)`.
+        x: Simulations of shape `(batch_dim, *event_shape)`.
     """
+    # This only is checked for density estimators, not for classifiers and others.
+    # Looking up the class dicts avoids the `nn.Module.__getattr__` fallback through
+    # parameters, buffers and submodules for nets without `log_prob`.
+    if not any("log_prob" in cls.__dict__ for cls in type(net).__mro__):
+        return
+
+    embedding_net = getattr(net, "embedding_net", None)
+    modules = (
+        embedding_net.modules()
+        if isinstance(embedding_net, nn.Module)
+        else (embedding_net,)
+    )
+    signature = (
+        tuple(f"{type(m).__module__}.{type(m).__qualname__}" for m in modules),
+        theta.shape[2:],
+        x.shape[1:],
+    )
+    validated_signatures = _validated_net_signatures.setdefault(type(net), set())
+    if signature in validated_signatures:
+        return
+
+    # Without an embedding net, x with several non-trivial event dimensions cannot be
+    # reduced to the flat condition of the estimator, so there is no need to run the
+    # forward pass.
+    multi_d_event = sum(size > 1 for size in x.shape[1:]) > 1
+    if multi_d_event and _is_identity_embedding(embedding_net):
+        raise RuntimeError(_multi_d_x_debug_hint(x))
+
+    # Views on the first simulations, `theta` has a leading sample dimension.
+    theta_probe = theta.narrow(1, 0, min(_NET_PROBE_BATCH_SIZE, theta.shape[1]))
+    x_probe = x.narrow(0, 0, min(_NET_PROBE_BATCH_SIZE, x.shape[0]))
+
+    # Copy only the probe to the device of the net, asynchronously for CUDA.
+    parameter = next(net.parameters(), None) if isinstance(net, nn.Module) else None
+    if parameter is not None and parameter.device != x_probe.device:
+        non_blocking = parameter.device.type == "cuda"
+        theta_probe = theta_probe.to(parameter.device, non_blocking=non_blocking)
+        x_probe = x_probe.to(parameter.device, non_blocking=non_blocking)
+
     try:
-        # torch.nn.functional needs at least two inputs here.
-        if hasattr(net, "log_prob"):
-            # This only is checked for density estimators, not for classifiers and
-            # others
-            net.log_prob(theta[:, :2], condition=x[:2])
+        # The result is discarded, so no autograd graph has to be built.
+        with torch.no_grad():
+            net.log_prob(theta_probe, condition=x_probe)
 
     except RuntimeError as rte:
-        ndims = x.ndim
-        if ndims > 2:
-            message = f"""Debug hint: The simulated data x has {ndims - 1} dimensions.
+        if x_probe.is_cuda:
+            # The frames of the failed forward pass keep its activations alive until
+            # the exception is dropped. Clearing their locals keeps the traceback
+            # printable and allows to free the memory before re-raising.
+            traceback.clear_frames(rte.__traceback__)
+            torch.cuda.empty_cache()
+        # Errors unrelated to multidimensional x are raised unchanged.
+        if x.ndim <= 2:
+            raise
+        raise RuntimeError(_multi_d_x_debug_hint(x)) from rte
+
+    validated_signatures.add(signature)
+
+
+def _is_identity_embedding(embedding_net: Optional[nn.Module]) -> bool:
+    """Return whether the embedding net only z-scores its input, if at all.
+
+    With z-scoring, the net builders wrap the embedding net as
+    `nn.Sequential(Standardize, embedding_net)`.
+    """
+    if isinstance(embedding_net, nn.Sequential):
+        return all(
+            isinstance(module, (nn.Identity, Standardize)) for module in embedding_net
+        )
+    return isinstance(embedding_net, nn.Identity)
+
+
+def _multi_d_x_debug_hint(x: Tensor) -> str:
+    """Return a debug hint for nets that fail on multidimensional x."""
+    return f"""Debug hint: The simulated data x has {x.ndim - 1} dimensions.
             With default settings, sbi cannot deal with multidimensional simulations.
             Make sure to use an embedding net that reduces the dimensionality, e.g., a
             CNN in case of images, or change the simulator to return one-dimensional x.
             """
-        else:
-            message = ""
-
-        raise RuntimeError(message) from rte
@@ -11,6 +11,7 @@ from torch.distributions import (
     Binomial,
     Categorical,
     Distribution,
+    Independent,
     Multinomial,
     MultivariateNormal,
     constraints,
@@ -405,6 +406,14 @@ class MultipleIndependent(Distribution):
             # ignoring because it is related to torch and not sbi
             if hasattr(self.dists[i], "to"):
                 self.dists[i].to(device)  # type: ignore
+            elif isinstance(self.dists[i], Independent):
+                # `Independent` has no parameters itself, so rebuild its base dist.
+                base_dist = self.dists[i].base_dist  # type: ignore
+                params = get_distribution_parameters(base_dist, device)
+                self.dists[i] = Independent(
+                    type(base_dist)(**params),  # type: ignore
+                    self.dists[i].reinterpreted_batch_ndims,  # type: ignore
+                )
             else:
                 params = get_distribution_parameters(self.dists[i], device)
                 self.dists[i] = type(self.dists[i])(**params)  # type: ignore
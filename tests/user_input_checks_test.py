@@ -7,6 +7,7 @@ from typing import Callable, Tuple
 
 import numpy as np
 import pytest
+import scipy.stats
 import torch
 from pyknos.mdn.mdn import MultivariateGaussianMDN
 from torch import Tensor, eye, nn, ones, zeros
@@ -16,20 +17,28 @@ from torch.distributions import (
     Exponential,
     Gamma,
     MultivariateNormal,
+    Normal,
     Uniform,
 )
 
 from sbi.inference import NPE_A, NPE_C, simulate_for_sbi
 from sbi.inference.posteriors.direct_posterior import DirectPosterior
+from sbi.neural_nets import posterior_nn
 from sbi.simulators import linear_gaussian
 from sbi.simulators.linear_gaussian import diagonal_linear_gaussian
 from sbi.utils import mcmc_transform, within_support
 from sbi.utils.torchutils import BoxUniform
 from sbi.utils.user_input_checks import (
+    check_prior_support,
     check_sbi_inputs,
+    mark_batched,
     process_prior,
     process_simulator,
     process_x,
+    wrap_as_joblib_efficient_simulator,
+)
+from sbi.utils.user_input_checks import (
+    test_posterior_net_for_multi_d_x as check_net_for_multi_d_x,
 )
 from sbi.utils.user_input_checks_utils import (
     CustomPriorWrapper,
@@ -202,6 +211,79 @@ def test_process_prior(prior):
     )
 
 
+@pytest.mark.parametrize(
+    "prior, is_wrapped",
+    (
+        (MultivariateNormal(zeros(3).double(), eye(3).double()), False),
+        (Gamma(ones(1).double(), ones(1).double()), False),
+        (
+            MultipleIndependent([
+                Gamma(ones(1).double(), ones(1).double()),
+                Beta(ones(1).double(), ones(1).double()),
+            ]),
+            True,
+        ),
+    ),
+)
+def test_process_float64_prior(prior, is_wrapped: bool):
+    """Test that float64 priors are cast to float32, with a wrapper if needed."""
+    prior, _, _ = process_prior(prior)
+    wrapper = prior.prior if isinstance(prior, OneDimPriorWrapper) else prior
+    assert isinstance(wrapper, PytorchReturnTypeWrapper) == is_wrapped
+
+    theta = prior.sample((2,))
+    assert theta.dtype == torch.float32
+    assert prior.log_prob(theta).dtype == torch.float32
+
+
+def test_process_float64_1d_uniform_prior():
+    """Test that a float64 1D Uniform is cast to a plain BoxUniform."""
+    prior = Uniform(zeros(1, dtype=torch.float64), ones(1, dtype=torch.float64))
+    with pytest.warns(UserWarning, match="Casting 1D Uniform"):
+        prior, _, _ = process_prior(prior)
+    assert type(prior) is BoxUniform
+    assert prior.sample((2,)).dtype == torch.float32
+
+
+@pytest.mark.parametrize(
+    "prior",
+    (
+        scipy.stats.norm(0.0, 1.0),
+        scipy.stats.multivariate_normal(np.zeros(2), np.eye(2)),
+    ),
+)
+def test_scipy_prior_raises(prior):
+    with pytest.raises(NotImplementedError):
+        process_prior(prior)
+
+
+def test_process_prior_is_cached():
+    """Test that processing the same prior twice reuses the first result."""
+    prior = BoxUniform(zeros(3, dtype=torch.float64), ones(3, dtype=torch.float64))
+
+    processed = process_prior(prior)
+    assert process_prior(prior) is processed
+    assert process_prior(prior, force=True) is not processed
+
+    # Components of a sequence prior are processed again with `force=True`, too.
+    mvn = MultivariateNormal(zeros(2), eye(2))
+    sequence_prior = [mvn, Gamma(ones(1), ones(1))]
+    process_prior(sequence_prior)
+    processed_mvn = mvn._sbi_processed_prior
+    process_prior(sequence_prior)
+    assert mvn._sbi_processed_prior is processed_mvn
+    process_prior(sequence_prior, force=True)
+    assert mvn._sbi_processed_prior is not processed_mvn
+
+    # Results for custom kwargs are not cached.
+    custom_prior = UserNumpyUniform(zeros(3), ones(3), return_numpy=True)
+    kwargs = dict(lower_bound=zeros(3), upper_bound=ones(3))
+    processed = process_prior(custom_prior, custom_prior_wrapper_kwargs=kwargs)
+    assert (
+        process_prior(custom_prior, custom_prior_wrapper_kwargs=kwargs) is not processed
+    )
+
+
 @pytest.mark.parametrize(
     "x, x_shape",
     (
@@ -210,10 +292,17 @@ def test_process_prior(prior):
         (ones(10, 3), torch.Size([10, 3])),  # 2D data / iid NPE
         pytest.param(ones(10, 3), None),  # 2D data / iid NPE without x_shape
         (ones(10, 10), torch.Size([10])),  # iid likelihood based
+        (torch.tensor(1.0), torch.Size([1])),  # scalar data
+        (ones(2, 2), torch.Size([2, 2])),  # 2D data without batch dim
+        (np.ones((1, 3)), torch.Size([3])),  # float64 numpy data
+        (np.arange(6.0).reshape(2, 3)[::-1], torch.Size([3])),  # negative strides
     ),
 )
 def test_process_x(x, x_shape):
-    process_x(x, x_shape)
+    x = process_x(x, x_shape)
+    assert isinstance(x, Tensor) and x.dtype == torch.float32
+    if x_shape is not None:
+        assert x.shape[1:] == x_shape
 
 
 @pytest.mark.parametrize(
@@ -246,6 +335,89 @@ def test_process_simulator(simulator: Callable, prior: Distribution, x_shape: Tu
     assert x.shape[1:] == x_shape
 
 
+@pytest.mark.parametrize("num_workers", (1, 2))
+@pytest.mark.parametrize("x_event_shape", (None, torch.Size([2])))
+def test_batch_loop_simulator(num_workers: int, x_event_shape):
+    """Test that looping over a batch keeps order and shapes."""
+    prior = BoxUniform(zeros(2), ones(2))
+
+    def simulator_no_batch(theta):
+        assert theta.ndim == 1, "cant handle batches."
+        return 2 * theta
+
+    simulator = process_simulator(
+        simulator_no_batch,
+        prior,
+        False,
+        num_workers=num_workers,
+        x_event_shape=x_event_shape,
+    )
+
+    theta = prior.sample((10,))
+    x = simulator(theta)
+    assert x.shape == theta.shape
+    assert torch.allclose(x, 2 * theta)
+
+
+def test_marked_batched_simulator_is_not_probed():
+    """Test that simulators marked as batched are used without a probe simulation."""
+    prior = BoxUniform(zeros(2), ones(2))
+    calls = []
+
+    @mark_batched
+    def batched_simulator(theta):
+        calls.append(theta.shape)
+        return 2 * theta
+
+    simulator = process_simulator(batched_simulator, prior, False)
+    assert calls == []
+
+    theta = prior.sample((10,))
+    assert torch.allclose(simulator(theta), 2 * theta)
+    assert calls == [theta.shape]
+
+
+def test_mark_batched_methods_and_builtins():
+    """Test that bound methods can be marked, and builtins raise a clear error."""
+
+    class Model:
+        def simulate(self, theta):
+            return 2 * theta
+
+    model = Model()
+    assert mark_batched(model.simulate) == model.simulate
+    prior = BoxUniform(zeros(2), ones(2))
+    simulator = process_simulator(model.simulate, prior, False)
+    theta = prior.sample((10,))
+    assert torch.allclose(simulator(theta), 2 * theta)
+
+    with pytest.raises(TypeError, match="wrap it in a Python function"):
+        mark_batched(torch.exp)
+
+
+@pytest.mark.parametrize("is_numpy_simulator", (True, False))
+def test_joblib_simulator_input_types(is_numpy_simulator: bool):
+    """Test that the wrapped simulator receives the type it expects."""
+    prior = BoxUniform(zeros(2), ones(2))
+    expected_type = np.ndarray if is_numpy_simulator else Tensor
+    x_out = ones(1, 2)
+
+    def simulator(theta):
+        assert isinstance(theta, expected_type)
+        return x_out.numpy() if is_numpy_simulator else x_out
+
+    joblib_simulator = wrap_as_joblib_efficient_simulator(
+        simulator, prior, is_numpy_simulator
+    )
+    for theta in (prior.sample((1,)), prior.sample((1,)).numpy()):
+        x = joblib_simulator(theta)
+        assert isinstance(x, Tensor) and x.dtype == torch.float32
+
+    if not is_numpy_simulator:
+        # float32 tensors are passed through without a copy.
+        assert joblib_simulator(prior.sample((1,))) is x_out
+
+
 @pytest.mark.parametrize(
     "simulator, prior",
     (
@@ -299,6 +471,135 @@ def test_prepare_sbi_problem(simulator: Callable, prior):
     assert prior.sample().dtype == torch.float32
 
 
+def test_check_sbi_inputs_runs_once():
+    """Test that an already validated (simulator, prior) pair is not simulated again."""
+    num_calls = 0
+
+    def simulator(theta):
+        nonlocal num_calls
+        num_calls += 1
+        return theta
+
+    prior, _, _ = process_prior(BoxUniform(zeros(2), ones(2)))
+    check_sbi_inputs(simulator, prior)
+    check_sbi_inputs(simulator, prior)
+    assert num_calls == 1
+
+    # A new prior has to be checked again.
+    check_sbi_inputs(simulator, process_prior(BoxUniform(zeros(2), ones(2)))[0])
+    assert num_calls == 2
+
+
+def test_check_sbi_inputs_runs_once_for_processed_simulators():
+    """Test that rounds of `process_simulator` reuse the validation of the pair."""
+    batch_sizes = []
+
+    def simulator(theta):
+        batch_sizes.append(theta.shape[0])
+        return theta
+
+    user_prior = BoxUniform(zeros(2), ones(2))
+    for _ in range(3):
+        prior, _, prior_returns_numpy = process_prior(user_prior)
+        processed_simulator = process_simulator(simulator, prior, prior_returns_numpy)
+        check_sbi_inputs(processed_simulator, prior)
+
+    # `check_sbi_inputs` simulates a single parameter, the batch probe of
+    # `process_simulator` two of them.
+    assert batch_sizes.count(1) == 1
+    assert batch_sizes.count(2) == 3
+
+
+def test_check_prior_support_runs_once():
+    """Test that the support check does not sample an already checked prior."""
+    prior = BoxUniform(zeros(2), ones(2))
+    sample = prior.sample
+    num_calls = 0
+
+    def counting_sample(*args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        return sample(*args, **kwargs)
+
+    prior.sample = counting_sample
+    check_prior_support(prior)
+    check_prior_support(prior)
+    assert num_calls == 1
+
+
+class CountingDensityEstimator(nn.Module):
+    """Density estimator stub which counts its `log_prob` calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.num_calls = 0
+
+    def log_prob(self, input: Tensor, condition: Tensor) -> Tensor:
+        self.num_calls += 1
+        if condition.ndim > 2:
+            raise RuntimeError("mat1 and mat2 shapes cannot be multiplied")
+        return zeros(input.shape[:-1])
+
+
+def test_multi_d_x_check_runs_once_per_signature():
+    """Test that nets of the same type and event shapes are probed only once."""
+    theta, x = zeros(1, 5, 2), zeros(5, 3)
+    net = CountingDensityEstimator()
+    check_net_for_multi_d_x(net, theta, x)
+    other_net = CountingDensityEstimator()
+    check_net_for_multi_d_x(other_net, theta, x)
+    assert (net.num_calls, other_net.num_calls) == (1, 0)
+
+    # Different event shapes of x have to be checked again.
+    check_net_for_multi_d_x(other_net, theta, zeros(5, 4))
+    assert other_net.num_calls == 1
+
+    # Failing checks are not remembered.
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="Debug hint"):
+            check_net_for_multi_d_x(net, theta, zeros(5, 3, 3))
+    assert net.num_calls == 3
+
+
+def test_multi_d_x_check_distinguishes_embedding_nets():
+    """Test that a passing net with embedding does not skip a net without one."""
+    theta, x = torch.randn(10, 2), torch.randn(10, 3, 4)
+    embedding_net = nn.Sequential(nn.Flatten(), nn.Linear(12, 12))
+    net = posterior_nn("maf", embedding_net=embedding_net)(theta, x)
+    check_net_for_multi_d_x(net, theta.unsqueeze(0), x)
+
+    # The builders wrap both embedding nets in `nn.Sequential` with a z-scoring net,
+    # so the net without embedding must not hit the entry of the net above.
+    net = posterior_nn("maf")(theta, x)
+    with pytest.raises(RuntimeError, match="Debug hint"):
+        check_net_for_multi_d_x(net, theta.unsqueeze(0), x)
+
+
+def test_multi_d_x_check_keeps_unrelated_errors():
+    """Test that errors for one-dimensional x are not replaced by the debug hint."""
+
+    class FailingDensityEstimator(nn.Module):
+        def log_prob(self, input: Tensor, condition: Tensor) -> Tensor:
+            raise RuntimeError("unrelated failure")
+
+    with pytest.raises(RuntimeError, match="unrelated failure"):
+        check_net_for_multi_d_x(FailingDensityEstimator(), zeros(1, 5, 2), zeros(5, 3))
+
+
+@pytest.mark.parametrize("z_score_x", ("independent", "none"))
+def test_multi_d_x_without_embedding_net_is_not_probed(z_score_x: str, monkeypatch):
+    """Test that multidimensional x without embedding net fails before log_prob."""
+    theta, x = torch.randn(10, 2), torch.randn(10, 3, 3)
+    net = posterior_nn("maf", z_score_x=z_score_x)(theta, x)
+
+    def log_prob(*args, **kwargs):
+        raise AssertionError("log_prob must not be called.")
+
+    monkeypatch.setattr(net, "log_prob", log_prob)
+    with pytest.raises(RuntimeError, match="Debug hint"):
+        check_net_for_multi_d_x(net, theta.unsqueeze(0), x)
+
+
 @pytest.mark.parametrize("snpe_method", [NPE_A, NPE_C])
 @pytest.mark.parametrize(
     "user_simulator, user_prior",
@@ -453,6 +754,48 @@ def test_independent_joint_shapes_and_samples(dists):
     assert within_support.all()
 
 
+def test_merge_homogeneous_priors():
+    """Test that consecutive univariate priors are merged without changing the joint."""
+    dists = [
+        Normal(zeros(1), ones(1)),
+        Normal(ones(1), 2 * ones(1)),
+        Gamma(ones(1), ones(1)),
+        Gamma(2 * ones(1), ones(1)),
+        MultivariateNormal(zeros(2), eye(2)),
+        Normal(zeros(1), ones(1)),
+    ]
+    prior, theta_numel, _ = process_prior(dists)
+
+    assert theta_numel == 7
+    assert isinstance(prior, MultipleIndependent)
+    assert len(prior.dists) == 4
+
+    theta = prior.sample((10,))
+    expected_log_prob = torch.stack(
+        [
+            dists[0].log_prob(theta[:, :1]),
+            dists[1].log_prob(theta[:, 1:2]),
+            dists[2].log_prob(theta[:, 2:3]),
+            dists[3].log_prob(theta[:, 3:4]),
+            dists[4].log_prob(theta[:, 4:6]).unsqueeze(1),
+            dists[5].log_prob(theta[:, 6:]),
+        ],
+        dim=1,
+    ).sum((1, 2))
+    assert torch.allclose(prior.log_prob(theta), expected_log_prob)
+
+
+def test_process_many_independent_priors():
+    """Test that priors processed in parallel keep their order."""
+    dists = [
+        Gamma(ones(1), ones(1)) if i % 2 else Beta(ones(1), ones(1)) for i in range(10)
+    ]
+    prior, theta_numel, _ = process_prior(dists)
+
+    assert theta_numel == len(dists)
+    assert [type(d.prior) for d in prior.dists] == [type(d) for d in dists]
+
+
 def test_invalid_inputs():
     dists = [
         Gamma(ones(1), ones(1)),